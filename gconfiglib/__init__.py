@@ -4,19 +4,67 @@
 
 """ Enhanced Configuration library. """
 
-# ruff: noqa: F401
-# flake8: noqa: F401
-
-
+import importlib
 import logging
+import os
+import sys
+from typing import Any, Dict, List
 
-from .config_attribute import ConfigAttribute
-from .config_node import ConfigNode
-from .config_root import ConfigRoot
-from .template_attr_fixed import TemplateAttributeFixed
-from .template_attr_variable import TemplateAttributeVariable
-from .template_node_fixed import TemplateNodeFixed
-from .template_node_set import TemplateNodeSet
-from .template_node_variable import TemplateNodeVariableAttr
+__all__ = (
+    "ConfigAttribute",
+    "ConfigNode",
+    "ConfigRoot",
+    "TemplateAttributeFixed",
+    "TemplateAttributeVariable",
+    "TemplateNodeFixed",
+    "TemplateNodeSet",
+    "TemplateNodeVariableAttr",
+)
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
+
+# Public classes are imported from their submodules on first access
+_LAZY_MAP: Dict[str, str] = {
+    "ConfigAttribute": "config_attribute",
+    "ConfigNode": "config_node",
+    "ConfigRoot": "config_root",
+    "TemplateAttributeFixed": "template_attr_fixed",
+    "TemplateAttributeVariable": "template_attr_variable",
+    "TemplateNodeFixed": "template_node_fixed",
+    "TemplateNodeSet": "template_node_set",
+    "TemplateNodeVariableAttr": "template_node_variable",
+}
+
+def __getattr__(name: str) -> Any:
+    """
+    Import public class from its submodule on first access
+    :param name: class name
+    :return: requested class
+    """
+    submodule = _LAZY_MAP.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    full_name = f"{__name__}.{submodule}"
+    # Submodule may already be loaded by another import - skip the import machinery then
+    module = sys.modules.get(full_name) or importlib.import_module(full_name)
+    value = module.__dict__[name]
+    # Cache in module globals, so that __getattr__ is not called again for this name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
+
+
+if os.environ.get("GCONFIGLIB_BG_IMPORT") == "1":
+    # Opt-in: load configuration classes in a background thread,
+    # so that import cost overlaps with the rest of application startup
+    import threading
+
+    threading.Thread(
+        target=importlib.import_module,
+        args=(f"{__name__}.config_root",),
+        name="gconfiglib-preload",
+        daemon=True,
+    ).start()
@@ -0,0 +1,23 @@
+from .config_attribute import ConfigAttribute as ConfigAttribute
+from .config_node import ConfigNode as ConfigNode
+from .config_root import ConfigRoot as ConfigRoot
+from .template_attr_fixed import TemplateAttributeFixed as TemplateAttributeFixed
+from .template_attr_variable import (
+    TemplateAttributeVariable as TemplateAttributeVariable,
+)
+from .template_node_fixed import TemplateNodeFixed as TemplateNodeFixed
+from .template_node_set import TemplateNodeSet as TemplateNodeSet
+from .template_node_variable import (
+    TemplateNodeVariableAttr as TemplateNodeVariableAttr,
+)
+
+__all__ = (
+    "ConfigAttribute",
+    "ConfigNode",
+    "ConfigRoot",
+    "TemplateAttributeFixed",
+    "TemplateAttributeVariable",
+    "TemplateNodeFixed",
+    "TemplateNodeSet",
+    "TemplateNodeVariableAttr",
+)
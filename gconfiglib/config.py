@@ -14,12 +14,10 @@ from types import ModuleType
 from typing import Callable, Type
 from urllib import parse as urlparse
 
-from kazoo.client import KazooClient
-from kazoo.security import make_digest_acl
-
 from gconfiglib import utils
 from gconfiglib.config_node import ConfigNode
 from gconfiglib.config_root import ConfigRoot
+from gconfiglib.enums import Source
 from gconfiglib.template_node_base import TemplateNodeBase
 
 
@@ -80,8 +78,14 @@ def cfgctl(args: argparse.Namespace) -> None:
     logger.addHandler(console_handler)
 
     if args.source:
-        src: urlparse.ParseResult = urlparse.urlparse(args.source)
-        if src.scheme == "zookeeper":
+        source: Source = utils.source_type(args.source)
+        if source == Source.ZOOKEEPER:
+            # Imported here, so that Zookeeper client is only loaded when it is actually used
+            from kazoo.client import KazooClient
+            from kazoo.security import make_digest_acl
+
+            # URI components are only needed for Zookeeper
+            src: urlparse.ParseResult = urlparse.urlparse(args.source)
             zk_s = KazooClient(
                 hosts=src.hostname,
                 default_acl=[make_digest_acl(src.username, src.password, all=True)],
@@ -108,14 +112,18 @@ def cfgctl(args: argparse.Namespace) -> None:
     if args.action == "ls":
         print(str(cfg_src))
     elif args.action == "rm" and args.source:
-        if src.scheme == "zookeeper":
+        if source == Source.ZOOKEEPER:
             if zk_s.exists(src.path):
                 zk_s.delete(src.path, recursive=True)
         else:
             os.system("rm -f " + args.source)
     elif args.action == "cp" and args.source and args.dest:
-        dest: urlparse.ParseResult = urlparse.urlparse(args.dest)
-        if dest.scheme == "zookeeper":
+        destination: Source = utils.source_type(args.dest)
+        if destination == Source.ZOOKEEPER:
+            from kazoo.client import KazooClient
+            from kazoo.security import make_digest_acl
+
+            dest: urlparse.ParseResult = urlparse.urlparse(args.dest)
             zk_d = KazooClient(
                 hosts=dest.hostname,
                 default_acl=[make_digest_acl(dest.username, dest.password, all=True)],
@@ -142,14 +150,12 @@ def cfgctl(args: argparse.Namespace) -> None:
                 )
             zk_d.stop()
         else:
-            if len(args.dest) > 5 and args.dest[-5:] == ".json":
+            if destination == Source.JSON:
                 cfg_src.write().json(args.dest)
             else:
                 cfg_src.write().cfg(args.dest)
-    if args.source:
-        src: urlparse.ParseResult = urlparse.urlparse(args.source)
-        if src.scheme == "zookeeper":
-            zk_s.stop()
+    if args.source and source == Source.ZOOKEEPER:
+        zk_s.stop()
 
 
 if __name__ == "__main__":
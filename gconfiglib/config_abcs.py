@@ -1,7 +1,6 @@
 """Abstract configuration object class.
 """
 from abc import ABC, abstractmethod
-from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from gconfiglib.enums import NodeType
@@ -10,8 +9,12 @@ from gconfiglib.enums import NodeType
 class ConfigObject(ABC):
     """Abstract configuration object class."""
 
+    __slots__ = ()
+
     name: str
     parent: Optional["ConfigNodeABC"]
+    # Cached result of get_path()
+    _path: Optional[str]
 
 
 class ConfigAttributeABC(ConfigObject):
@@ -19,12 +22,18 @@ class ConfigAttributeABC(ConfigObject):
     Configuration attribute abstract class
     """
 
+    __slots__ = ()
+
     value: Any
 
     @abstractmethod
     def _set_parent(self, parent_node: "ConfigNodeABC") -> None:
         pass
 
+    @abstractmethod
+    def _clear_path(self) -> None:
+        pass
+
     @abstractmethod
     def _to_dict(self) -> Any:
         pass
@@ -46,7 +55,11 @@ class ConfigNodeABC(ConfigObject):
     Configuration node abstract class
     """
 
-    attributes: OrderedDict[str, ConfigObject]
+    __slots__ = ()
+
+    attributes: Dict[str, ConfigObject]
+    # Cached results of _get_obj
+    _obj_cache: Dict[str, ConfigObject]
     node_type: NodeType
     zk_path: Optional[str]
     depth: int
@@ -78,10 +91,16 @@ class ConfigNodeABC(ConfigObject):
         """
 
     @abstractmethod
-    def _to_dict(self) -> OrderedDict[str, Any]:
+    def _clear_path(self) -> None:
+        """
+        Internal method. Drop cached path of this node and everything below it
+        """
+
+    @abstractmethod
+    def _to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary
-        :return: Node's content converted to OrderedDict
+        :return: Node's content converted to dictionary
         """
 
     @abstractmethod
@@ -93,19 +112,19 @@ class ConfigNodeABC(ConfigObject):
         """
 
     @abstractmethod
-    def get(self, path: Optional[str] = None) -> Optional[OrderedDict[str, Any] | Any]:
+    def get(self, path: Optional[str] = None) -> Optional[Dict[str, Any] | Any]:
         """
-        Retrieve object at path as OrderedDict
+        Retrieve object at path as dictionary
         :param path: Path
-        :return: OrderedDict, attribute value or None
+        :return: dictionary, attribute value or None
         """
 
     @abstractmethod
-    def get_attributes(self, path: Optional[str] = None) -> OrderedDict[str, Any]:
+    def get_attributes(self, path: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieve attributes of a node at path
         :param path: Path to a node
-        :return: OrderedDict with 'attribute': 'value' pairs
+        :return: dictionary with 'attribute': 'value' pairs
         """
 
     @abstractmethod
@@ -147,7 +166,7 @@ class ConfigNodeABC(ConfigObject):
     @abstractmethod
     def _search_here(
         self, name: str, criteria: Callable[[Any], bool], depth: int, recursive: bool
-    ) -> List[str]:
+    ) -> Tuple[List[str], Optional[int]]:
         pass
 
     @abstractmethod
@@ -2,6 +2,7 @@
 import logging
 from typing import Any, Optional
 
+from gconfiglib import utils
 from gconfiglib.config_abcs import ConfigAttributeABC, ConfigNodeABC
 
 logger = logging.getLogger(__name__)
@@ -12,16 +13,23 @@ class ConfigAttribute(ConfigAttributeABC):
     Configuration attribute class
     """
 
+    __slots__ = ("name", "value", "parent", "_path")
+
     def __init__(
         self, name: str, value: Any, parent: Optional[ConfigNodeABC] = None
     ) -> None:
-        self.name: str = name
+        self.name: str = utils.intern_name(name)
         self.value: Any = value
         self.parent: Optional[ConfigNodeABC] = parent
+        self._path: Optional[str] = None
         logger.info("Created attribute %s: %s", self.name, self.value)
 
     def _set_parent(self, parent_node: ConfigNodeABC) -> None:
         self.parent = parent_node
+        self._path = None
+
+    def _clear_path(self) -> None:
+        self._path = None
 
     def _to_dict(self) -> Any:
         return self.value
@@ -34,9 +42,12 @@ class ConfigAttribute(ConfigAttributeABC):
         Get this attribute's path from the root
         :return: string with full path to this attribute
         """
-        if self.parent is None:
-            return self.name
-        return self.parent.get_path() + "/" + self.name
+        if self._path is None:
+            if self.parent is None:
+                self._path = self.name
+            else:
+                self._path = self.parent.get_path() + "/" + self.name
+        return self._path
 
     def __str__(self) -> str:
         """
@@ -1,22 +1,68 @@
 """ Configuration Node class."""
 
+import json
 import logging
 import os
-from collections import OrderedDict
 from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
+from gconfiglib import utils
 from gconfiglib.config_abcs import ConfigNodeABC, ConfigObject
 from gconfiglib.config_attribute import ConfigAttribute
 from gconfiglib.enums import NodeType
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of paths cached by ConfigNode._get_obj in each node
+_OBJ_CACHE_SIZE = 1024
+
+# Encoder for attribute values and names in ConfigNode._dump_json
+_JSON_ENCODER = json.JSONEncoder(
+    ensure_ascii=True, indent=4, default=utils.json_serial, separators=(",", ": ")
+)
+
+
+def _json_key(key: Any) -> str:
+    """
+    Internal method. Converts dictionary key to string the same way json module does
+    :param key: attribute or node name
+    :return: JSON-encoded key
+    """
+    if isinstance(key, str):
+        return _JSON_ENCODER.encode(key)
+    if key is True:
+        return '"true"'
+    if key is False:
+        return '"false"'
+    if key is None:
+        return '"null"'
+    if isinstance(key, (int, float)):
+        return '"' + _JSON_ENCODER.encode(key) + '"'
+    logger.error(
+        "Keys must be str, int, float, bool or None, not %s", type(key).__name__
+    )
+    raise TypeError(
+        f"keys must be str, int, float, bool or None, not {type(key).__name__}"
+    )
+
 
 class ConfigNode(ConfigNodeABC):
     """
     Configuration node class
     """
 
+    # ConfigRoot does not declare slots and keeps its __dict__ for connection state
+    __slots__ = (
+        "name",
+        "parent",
+        "_path",
+        "_obj_cache",
+        "node_type",
+        "zk_path",
+        "template_gen",
+        "depth",
+        "attributes",
+    )
+
     def __init__(
         self,
         name: str,
@@ -45,8 +91,12 @@ class ConfigNode(ConfigNodeABC):
         :param template_gen: Function that takes configuration as parameter and generates the validation template
 
         """
-        self.name: str = name
+        self.name: str = utils.intern_name(name)
         self.parent: Optional["ConfigNode"] = parent
+        # Cached path from the root, reset when node is moved
+        self._path: Optional[str] = None
+        # Cached results of _get_obj, reset when content of this node or any node below changes
+        self._obj_cache: Dict[str, ConfigObject] = {}
         self.node_type: NodeType = node_type
         self.zk_path: Optional[str] = None
         self.template_gen: Optional[
@@ -57,7 +107,7 @@ class ConfigNode(ConfigNodeABC):
         if parent:
             self.depth = parent.depth + 1
 
-        self.attributes: OrderedDict[str, ConfigObject] = OrderedDict()
+        self.attributes: Dict[str, ConfigObject] = {}
 
         logger.info("Created node: %s", self.name)
 
@@ -87,6 +137,8 @@ class ConfigNode(ConfigNodeABC):
         Add content to a node
         :param attributes: Can be ConfigNode, ConfigAttribute, a dictionary, or a list of any of the above
         """
+        # Checked once, rather than for every element added in the loops below
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
         if isinstance(attributes, ConfigObject):
             # A single ConfigNode or ConfigAttribute
             logger.debug("Adding attribute %s to node %s", attributes.name, self.name)
@@ -97,28 +149,36 @@ class ConfigNode(ConfigNodeABC):
             for attribute in attributes:
                 if isinstance(attribute, ConfigObject):
                     # A ConfigNode or ConfigAttribute as a list element
-                    logger.debug(
-                        "Adding attribute %s to node %s", attribute.name, self.name
-                    )
+                    if debug:
+                        logger.debug(
+                            "Adding attribute %s to node %s", attribute.name, self.name
+                        )
                     self.attributes[attribute.name] = attribute
+                    attribute._set_parent(self)
                 elif isinstance(attribute, tuple) and len(attribute) == 2:
                     # A tuple will result either in the node or an attribute
                     if isinstance(attribute[1], dict) or isinstance(attribute[1], list):
                         # (name, dictionary) or (name, list) - create a node
-                        logger.debug(
-                            "Adding node %s to node %s", attribute[0], self.name
-                        )
-                        self.attributes[attribute[0]] = ConfigNode(
+                        if debug:
+                            logger.debug(
+                                "Adding node %s to node %s", attribute[0], self.name
+                            )
+                        node = ConfigNode(
                             attribute[0], parent=self, attributes=attribute[1]
                         )
+                        self.attributes[node.name] = node
                     else:
                         # (name, value) - create an attribute
-                        logger.debug(
-                            "Adding attribute %s to node %s", attribute[0], self.name
-                        )
-                        self.attributes[attribute[0]] = ConfigAttribute(
+                        if debug:
+                            logger.debug(
+                                "Adding attribute %s to node %s",
+                                attribute[0],
+                                self.name,
+                            )
+                        new_attribute = ConfigAttribute(
                             attribute[0], attribute[1], parent=self
                         )
+                        self.attributes[new_attribute.name] = new_attribute
                 else:
                     logger.error(
                         "ConfigNode.add only accepts single ConfigNode, ConfigAttribute, a list of ConfigNodes and/or ConfigAttributes or a list of tuples that can be used to create nodes and/or attributes."
@@ -133,16 +193,16 @@ class ConfigNode(ConfigNodeABC):
             for a_key, a_value in attributes.items():
                 if isinstance(a_value, dict):
                     # for a dic element, create a node
-                    logger.debug("Adding node %s to node %s", a_key, self.name)
-                    self.attributes[a_key] = ConfigNode(
-                        a_key, parent=self, attributes=a_value
-                    )
+                    if debug:
+                        logger.debug("Adding node %s to node %s", a_key, self.name)
+                    node = ConfigNode(a_key, parent=self, attributes=a_value)
+                    self.attributes[node.name] = node
                 else:
                     # for any other element, create an attribute
-                    logger.debug("Adding attribute %s to node %s", a_key, self.name)
-                    self.attributes[a_key] = ConfigAttribute(
-                        a_key, a_value, parent=self
-                    )
+                    if debug:
+                        logger.debug("Adding attribute %s to node %s", a_key, self.name)
+                    new_attribute = ConfigAttribute(a_key, a_value, parent=self)
+                    self.attributes[new_attribute.name] = new_attribute
         else:
             logger.error(
                 "ConfigNode.add only accepts single ConfigNode, ConfigAttribute, or a list of ConfigNodes and/or ConfigAttributes"
@@ -151,6 +211,7 @@ class ConfigNode(ConfigNodeABC):
                 "ConfigNode.add only accepts single ConfigNode, ConfigAttribute,"
                 "or a list of ConfigNodes and/or ConfigAttributes"
             )
+        self._clear_obj_cache()
         self.set_node_type(self.node_type, force=True)
 
     def delete(self, path: str) -> None:
@@ -163,37 +224,110 @@ class ConfigNode(ConfigNodeABC):
         if len(nodes) == 0:
             logger.error("No path to delete specified")
             raise ValueError("No path to delete specified")
-        if len(nodes) == 1:
-            # the path corresponds to this node
-            self.attributes.pop(nodes[0], None)
-        else:
-            # the path points to a node under this one
-            # adjust path and call delete method of that node
-            new_path = "/".join(nodes[1:])
-            self.attributes[nodes[0]].delete(new_path)
+        # walk down to the node that holds the last element of the path
+        node: ConfigNode = self
+        for node_name in nodes[:-1]:
+            node = node.attributes[node_name]
+        node.attributes.pop(nodes[-1], None)
+        node._clear_obj_cache()
 
     def _set_parent(self, parent_node: "ConfigNode") -> None:
         """
         Set node's parent
         :param parent_node: parent ConfigNode
         """
+        debug: bool = logger.isEnabledFor(logging.DEBUG)
         self.parent = parent_node
         self.depth = parent_node.depth + 1
-        logger.debug("Setting node's %s parent to %s", self.name, parent_node.name)
+        self._path = None
+        if debug:
+            logger.debug("Setting node's %s parent to %s", self.name, parent_node.name)
+        # recalculate depth and path for all nodes below, without recursion
+        stack: List[ConfigNode] = [self]
+        while stack:
+            node = stack.pop()
+            for child in node.attributes.values():
+                if type(child) is ConfigAttribute:
+                    child._path = None
+                elif isinstance(child, ConfigNode):
+                    child.parent = node
+                    child.depth = node.depth + 1
+                    child._path = None
+                    if debug:
+                        logger.debug(
+                            "Setting node's %s parent to %s", child.name, node.name
+                        )
+                    stack.append(child)
+                else:
+                    child._clear_path()
+
+    def _clear_path(self) -> None:
+        """
+        Internal method. Drop cached path of this node and everything below it
+        """
+        self._path = None
         for child in self.attributes.values():
-            # recalculate depth for child nodes
-            if isinstance(child, ConfigNode):
-                child._set_parent(self)
+            child._clear_path()
+
+    def _clear_obj_cache(self) -> None:
+        """
+        Internal method. Drop cached _get_obj results of this node and all nodes above it
+        """
+        node: Optional["ConfigNode"] = self
+        # Lookups are cached only in the node they were made on, so any node above this one
+        # may hold results that pass through it
+        while node is not None:
+            if node._obj_cache:
+                node._obj_cache.clear()
+            node = node.parent
 
-    def _to_dict(self) -> OrderedDict[str, Any]:
+    def _to_dict(self) -> Dict[str, Any]:
         """
         Convert to dictionary
-        :return: Node's content converted to OrderedDict
+        :return: Node's content converted to dictionary
+        """
+        result: Dict[str, Any] = {}
+        # (node, dictionary to fill with node's content) pairs still to be converted.
+        # Child dictionaries are inserted before they are filled, to keep attribute order
+        stack: List[Tuple[ConfigNode, Dict[str, Any]]] = [(self, result)]
+        while stack:
+            node, content = stack.pop()
+            for attribute_name, attribute_value in node.attributes.items():
+                # Exact type check first - isinstance on abstract classes is much slower
+                if type(attribute_value) is ConfigAttribute:
+                    content[attribute_name] = attribute_value.value
+                elif isinstance(attribute_value, ConfigNode):
+                    content[attribute_name] = {}
+                    stack.append((attribute_value, content[attribute_name]))
+                else:
+                    content[attribute_name] = attribute_value._to_dict()
+        return result
+
+    def _dump_json(self, write: Callable[[str], Any], level: int = 0) -> None:
         """
-        result: OrderedDict[str, Any] = OrderedDict()
+        Internal method. Serializes node content as JSON, in the same format as
+        json.dumps(self.get(), indent=4), without building the intermediate dictionary
+        :param write: function that receives serialized content piece by piece
+        :param level: indentation level of this node
+        """
+        if not self.attributes:
+            write("{}")
+            return
+        indent: str = "\n" + "    " * (level + 1)
+        separator: str = "{" + indent
         for attribute_name, attribute_value in self.attributes.items():
-            result[attribute_name] = attribute_value._to_dict()
-        return result
+            if isinstance(attribute_value, ConfigNode):
+                write(f"{separator}{_json_key(attribute_name)}: ")
+                attribute_value._dump_json(write, level + 1)
+            else:
+                # Lists and dictionaries in attribute values are indented to this level.
+                # Newlines can only be structural, since newlines in strings are escaped
+                value: str = _JSON_ENCODER.encode(attribute_value._to_dict()).replace(
+                    "\n", indent
+                )
+                write(f"{separator}{_json_key(attribute_name)}: {value}")
+            separator = "," + indent
+        write("\n" + "    " * level + "}")
 
     def _get_obj(
         self, path: Optional[str] = None
@@ -206,40 +340,54 @@ class ConfigNode(ConfigNodeABC):
         if not path:
             # no path means this is the node to return
             return self
-        # split path into components
-        nodes: List[str] = [x for x in path.split("/") if x != ""]
-        if len(nodes) == 0:
-            # path that splits into an empty list means this is the node to return
-            return self
-        next_obj = nodes[0]
-        new_path = "/".join(nodes[1:]) if len(nodes) > 1 else None
-        if next_obj not in self.attributes.keys():
-            # next level in the path does not exist in this node
-            return None
-        # go one level down the path recursively
-        return self.attributes[next_obj]._get_obj(new_path)
+        cached: Optional[ConfigObject] = self._obj_cache.pop(path, None)
+        if cached is not None:
+            # re-insert, so that the dictionary stays ordered from least to most recently used
+            self._obj_cache[path] = cached
+            return cached
+        # split path into components once and walk down without recursion.
+        # Path that splits into an empty list means this is the node to return
+        result: Optional[ConfigObject] = self
+        for node_name in path.split("/"):
+            if node_name == "":
+                continue
+            if type(result) is ConfigAttribute:
+                # an attribute is returned for any path below it
+                break
+            if node_name not in result.attributes:
+                # next level in the path does not exist in this node
+                result = None
+                break
+            result = result.attributes[node_name]
+        if result is not None:
+            # Misses are not cached, so that lookups of arbitrary missing paths don't fill the cache
+            if len(self._obj_cache) >= _OBJ_CACHE_SIZE:
+                # evict least recently used path
+                del self._obj_cache[next(iter(self._obj_cache))]
+            self._obj_cache[path] = result
+        return result
 
-    def get(self, path: Optional[str] = None) -> Optional[OrderedDict[str, Any] | Any]:
+    def get(self, path: Optional[str] = None) -> Optional[Dict[str, Any] | Any]:
         """
-        Retrieve object at path as OrderedDict
+        Retrieve object at path as dictionary
         :param path: Path
-        :return: OrderedDict, attribute value or None
+        :return: dictionary, attribute value or None
         """
         obj: Optional["ConfigNode | ConfigAttribute"] = self._get_obj(path)
         if obj is None:
             return None
         return obj._to_dict()
 
-    def get_attributes(self, path: Optional[str] = None) -> OrderedDict[str, Any]:
+    def get_attributes(self, path: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieve attributes of a node at path
         :param path: Path to a node
-        :return: OrderedDict with 'attribute': 'value' pairs
+        :return: dictionary with 'attribute': 'value' pairs
         """
         if path:
-            result: OrderedDict[str, Any] = self._get_obj(path).get_attributes()
+            result: Dict[str, Any] = self._get_obj(path).get_attributes()
         else:
-            result = OrderedDict()
+            result = {}
             for attribute_name, attribute_value in self.attributes.items():
                 if isinstance(attribute_value, ConfigAttribute):
                     result[attribute_name] = attribute_value._to_dict()
@@ -264,40 +412,41 @@ class ConfigNode(ConfigNodeABC):
         nodes: List[str] = [x for x in path.split("/") if x != ""]
         if len(nodes) == 0:
             self.add(value)
-        elif len(nodes) == 1:
+        else:
+            # walk down to the node that holds the last element of the path
+            node: ConfigNode = self
+            for node_name in nodes[:-1]:
+                node = node.attributes[node_name]
             if isinstance(value, ConfigNode):
-                self.add(value)
+                node.add(value)
             else:
-                self.add(OrderedDict([(nodes[0], value)]))
-        else:
-            next_obj = nodes[0]
-            new_path = "/".join(nodes[1:])
-            self.attributes[next_obj].set(new_path, value)
+                node.add({nodes[-1]: value})
 
     def get_path(self) -> str:
         """
         Get this node's path from the root
         :return: string with full path to this node
         """
-        if self.parent is None:
-            return f"/{self.name}" if self.name != "root" else ""
-        return f"{self.parent.get_path()}/{self.name}"
+        if self._path is None:
+            if self.parent is None:
+                self._path = f"/{self.name}" if self.name != "root" else ""
+            else:
+                self._path = f"{self.parent.get_path()}/{self.name}"
+        return self._path
 
     def __str__(self) -> str:
         """
         Get formatted node content
         """
         indent: str = "\t"
-        result: str = f"{indent * (self.depth - 1)}[{self.name}] : (Type:{self.node_type.name},Parent:{self.parent.name if self.parent else '/'}, Depth:{self.depth})"
-        for attribute in self.attributes.values():
-            result += str(attribute)
-        return result
+        header: str = f"{indent * (self.depth - 1)}[{self.name}] : (Type:{self.node_type.name},Parent:{self.parent.name if self.parent else '/'}, Depth:{self.depth})"
+        return header + "".join(str(attribute) for attribute in self.attributes.values())
 
     def __repr__(self) -> str:
         """Get string representation of the dictionary object
 
         Returns:
-            str: OrderedDict object converted to string
+            str: dictionary object converted to string
         """
         return self._to_dict().__repr__()
 
@@ -320,41 +469,54 @@ class ConfigNode(ConfigNodeABC):
         :param recursive: search using this same set of parameters in all child nodes and downward
         :return: list of paths that match search criteria
         """
-        return list(
-            {
-                os.path.join(path, result)
-                for element in self._get_obj(path).attributes.values()
-                if isinstance(element, ConfigNode)
-                for result in element._search_here(name, criteria, depth, recursive)
-            }
-        )
+        results: List[str] = []
+        for element in self._get_obj(path).attributes.values():
+            if isinstance(element, ConfigNode):
+                results.extend(
+                    os.path.join(path, result)
+                    for result in element._search_here(
+                        name, criteria, depth, recursive
+                    )[0]
+                )
+        # remove duplicates, keeping results in configuration order
+        return list(dict.fromkeys(results))
 
     def _search_here(
         self, name: str, criteria: Callable[[Any], bool], depth: int, recursive: bool
-    ) -> List[str]:
+    ) -> Tuple[List[str], Optional[int]]:
+        """
+        Internal method. Search this node and, depending on depth and recursive flag, nodes below it
+        Each child node is visited once: its results and match level are collected in the same pass
+        :return: list of matching paths and level of the closest match
+            (1 - attribute of this node, 2 - attribute of a child node, etc.), or None if no match was found
+        """
         results: List[str] = []
+        level: Optional[int] = None
         for a_name, attribute in self.attributes.items():
             if isinstance(attribute, ConfigNode):
+                if not recursive and depth <= 1:
+                    continue
+                child_results, child_level = attribute._search_here(
+                    name, criteria, depth if recursive else depth - 1, recursive
+                )
                 if recursive:
                     results += [
-                        os.path.join(self.name, result)
-                        for result in attribute._search_here(
-                            name, criteria, depth, recursive
-                        )
+                        os.path.join(self.name, result) for result in child_results
                     ]
-                if (
-                    depth > 1
-                    and len(attribute._search_here(name, criteria, depth - 1, False))
-                    > 0
-                ):
-                    results.append(self.name)
+                if child_level is not None:
+                    if child_level < depth:
+                        # match within depth levels below this node
+                        results.append(self.name)
+                    if level is None or child_level + 1 < level:
+                        level = child_level + 1
             else:
                 if name:
                     if name != a_name:
                         continue
                 if criteria(attribute.value):
                     results.append(self.name)
-        return results
+                    level = 1
+        return results, level
 
     def list_nodes(self, path: str = "/", fullpath: bool = False) -> List[str]:
         """
@@ -453,26 +615,39 @@ class ConfigNode(ConfigNodeABC):
                     )
 
             if parent_value:
-                # Change attribute of parent nodes
+                # Change attribute of parent nodes. A parent that was C or AN propagates
+                # the change to the rest of the hierarchy itself, so the walk stops there.
+                # CN to AN change doesn't propagate upward, so the walk continues past CN
                 cur_node = self.parent
                 while cur_node is not None:
+                    previous_value: NodeType = cur_node.node_type
                     cur_node.set_node_type(parent_value)
+                    if previous_value != NodeType.CN:
+                        break
                     cur_node = cur_node.parent
 
             if child_value:
-                # Change attribute of child nodes
+                # Change attribute of child nodes. Attributes are skipped by exact type first,
+                # as isinstance against the abstract base is comparatively slow
                 for child in self.attributes.values():
-                    if isinstance(child, ConfigNode):
+                    if type(child) is not ConfigAttribute and isinstance(
+                        child, ConfigNode
+                    ):
                         child.set_node_type(child_value)
         else:
-            # On force update
+            # On force update. This runs on every add, so child loops below skip attributes
+            # by exact type before falling back to isinstance
             if self.node_type == NodeType.AN:
                 # Change parent node type to AN
                 # Change child node type to CN if it's C
                 if self.parent:
                     self.parent.set_node_type(NodeType.AN)
                 for child in self.attributes.values():
-                    if isinstance(child, ConfigNode) and child.node_type == NodeType.C:
+                    if (
+                        type(child) is not ConfigAttribute
+                        and isinstance(child, ConfigNode)
+                        and child.node_type == NodeType.C
+                    ):
                         child.set_node_type(NodeType.CN)
             elif self.node_type == NodeType.CN:
                 # Change parent node type to AN
@@ -480,7 +655,9 @@ class ConfigNode(ConfigNodeABC):
                 if self.parent:
                     self.parent.set_node_type(NodeType.AN)
                 for child in self.attributes.values():
-                    if isinstance(child, ConfigNode):
+                    if type(child) is not ConfigAttribute and isinstance(
+                        child, ConfigNode
+                    ):
                         child.set_node_type(NodeType.C)
             else:
                 # (node type is C)
@@ -489,7 +666,9 @@ class ConfigNode(ConfigNodeABC):
                 if self.parent and self.parent.node_type == NodeType.AN:
                     self.parent.set_node_type(NodeType.CN)
                 for child in self.attributes.values():
-                    if isinstance(child, ConfigNode):
+                    if type(child) is not ConfigAttribute and isinstance(
+                        child, ConfigNode
+                    ):
                         child.set_node_type(NodeType.C)
 
     def _copy(self, node: "ConfigNode") -> None:
@@ -504,3 +683,8 @@ class ConfigNode(ConfigNodeABC):
         self.parent = node.parent
         self.template_gen = node.template_gen
         self.zk_path = node.zk_path
+        self._path = None
+        # Copied content still points to the node it was copied from
+        for child in self.attributes.values():
+            child._set_parent(self)
+        self._clear_obj_cache()
@@ -3,15 +3,15 @@
 import json
 import logging
 import os
-from collections import OrderedDict
-from typing import List, Optional, Tuple
-
-from kazoo.client import KazooClient
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
 
 from gconfiglib import utils
 from gconfiglib.config_node import ConfigNode
 from gconfiglib.enums import NodeType
 
+if TYPE_CHECKING:
+    from kazoo.client import KazooClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -41,16 +41,17 @@ class ConfigReader:
         """
         if check_file(filename):
             logger.info("Reading config file %s", filename)
-            with open(filename, "r", encoding="utf-8") as f:
-                return ConfigNode(
-                    "root",
-                    attributes=json.load(f, object_pairs_hook=utils.json_decoder),
-                )
+            # json.loads detects the encoding of raw bytes (UTF-8/16/32) itself
+            with open(filename, "rb") as f:
+                content: bytes = f.read()
+            return ConfigNode(
+                "root", attributes=utils.apply_decoder(json.loads(content))
+            )
         return None
 
     @staticmethod
     def zk(
-        connection: Optional[KazooClient], path: str, name: str = "root"
+        connection: Optional["KazooClient"], path: str, name: str = "root"
     ) -> Optional[ConfigNode]:
         """
         Reader for Zookeeper
@@ -64,32 +65,100 @@ class ConfigReader:
             raise IOError("No open Zookeeper connection")
         if not connection.exists(path):
             logger.error("Path %s does not exist", path)
-        else:
-            children: Optional[List[str]] = connection.get_children(path)
-            try:
-                logger.debug("Reading node %s at path %s", name, path)
-                node = ConfigNode(
-                    name,
-                    attributes=json.loads(
-                        connection.get(path)[0], object_pairs_hook=utils.json_decoder
-                    ),
-                    node_type=NodeType.CN,
-                )
-            except ValueError as e:
-                if str(e) == "No JSON object could be decoded" and len(children) > 0:
-                    node = ConfigNode(name)
-                else:
-                    logger.exception(
-                        "Unable to read the node at path %s", path, exc_info=True
-                    )
-                    raise
-            node.zk_path = path
-            if len(children) > 0:
-                node.set_node_type(NodeType.AN)
-                for child in children:
-                    node.add(ConfigReader().zk(connection, f"{path}/{child}", child))
-            return node
-        return None
+            return None
+        return build_zk_node(fetch_zk_tree(connection, path), path, name)
+
+
+def fetch_zk_tree(
+    connection: "KazooClient", path: str
+) -> Dict[str, Tuple[bytes, List[str]]]:
+    """
+    Internal method. Reads data and child names for every node in Zookeeper subtree.
+    Requests for all nodes at the same level are sent together, so reading the tree
+    takes one round-trip per level rather than two per node
+    :param connection: Zookeeper connection
+    :param path: path to root node of the subtree
+    :return: Dictionary of path: (node data, list of child names)
+    """
+    tree: Dict[str, Tuple[bytes, List[str]]] = {}
+    level: List[str] = [path]
+    while level:
+        requests = [
+            (
+                node_path,
+                connection.get_async(node_path),
+                connection.get_children_async(node_path),
+            )
+            for node_path in level
+        ]
+        level = []
+        for node_path, data_request, children_request in requests:
+            children: List[str] = children_request.get()
+            tree[node_path] = (data_request.get()[0], children)
+            level.extend(f"{node_path}/{child}" for child in children)
+    return tree
+
+
+def build_zk_node(
+    tree: Dict[str, Tuple[bytes, List[str]]], path: str, name: str
+) -> ConfigNode:
+    """
+    Internal method. Builds configuration node from Zookeeper subtree content.
+    The subtree is walked with an explicit stack. Every child is added to its parent
+    once its own subtree is complete, in the same order as the child names
+    :param tree: Subtree content, as returned by fetch_zk_tree
+    :param path: path to the node in Zookeeper
+    :param name: name to give the node
+    :return: ConfigNode
+    """
+    node = create_zk_node(tree, path, name)
+    stack: List[Tuple[ConfigNode, str, Iterator[str]]] = [
+        (node, path, iter(tree[path][1]))
+    ]
+    while stack:
+        cur_node, cur_path, children = stack[-1]
+        child: Optional[str] = next(children, None)
+        if child is None:
+            stack.pop()
+            if stack:
+                stack[-1][0].add(cur_node)
+            continue
+        child_path = f"{cur_path}/{child}"
+        child_node = create_zk_node(tree, child_path, child)
+        stack.append((child_node, child_path, iter(tree[child_path][1])))
+    return node
+
+
+def create_zk_node(
+    tree: Dict[str, Tuple[bytes, List[str]]], path: str, name: str
+) -> ConfigNode:
+    """
+    Internal method. Creates a single configuration node from Zookeeper node content, without its children
+    :param tree: Subtree content, as returned by fetch_zk_tree
+    :param path: path to the node in Zookeeper
+    :param name: name to give the node
+    :return: ConfigNode
+    """
+    data, children = tree[path]
+    logger.debug("Reading node %s at path %s", name, path)
+    if not data.strip() and len(children) > 0:
+        # Node without content of its own, e.g. created as a parent of other nodes.
+        # Nothing to parse, so there is no need to go through json.loads and its exception
+        node = ConfigNode(name)
+    else:
+        try:
+            node = ConfigNode(
+                name,
+                attributes=utils.apply_decoder(json.loads(data)),
+                node_type=NodeType.CN,
+            )
+        except ValueError:
+            logger.exception("Unable to read the node at path %s", path, exc_info=True)
+            raise
+    node.zk_path = path
+    if len(children) > 0:
+        node.set_node_type(NodeType.AN)
+    return node
 
 
 def check_file(filename: str) -> bool:
@@ -108,20 +177,21 @@ def check_file(filename: str) -> bool:
 
 def read_config(
     file_name: str,
-) -> OrderedDict[str, str | OrderedDict[str, str | List[str]]]:
+) -> Dict[str, str | Dict[str, str | List[str]]]:
     """
     Reads configuration from a file
     :param file_name: name of the configuration file
     :return: dictionary object with config key-value pairs
     :return: dictionary object with config key-value pairs
     """
-    conf: OrderedDict[str, str | OrderedDict[str, str | List[str]]] = OrderedDict()
+    conf: Dict[str, str | Dict[str, str | List[str]]] = {}
 
     cur_section: str = ""
     # Read the file
     if os.path.isfile(file_name) and os.access(file_name, os.R_OK):
         with open(file_name, "r", encoding="utf-8") as config_file:
-            config_data: List[str] = config_file.readlines()
+            # Single read of the whole file. Newlines are already normalized to '\n' in text mode
+            config_data: List[str] = config_file.read().split("\n")
         # For every line:
         for line in config_data:
             config_key, config_value = parse_config_line(line)
@@ -129,7 +199,7 @@ def read_config(
                 continue
             elif config_key == 1:
                 cur_section = config_value
-                conf[cur_section] = OrderedDict()
+                conf[cur_section] = {}
                 continue
 
             # Assign to section or sectionless
@@ -156,8 +226,7 @@ def parse_config_line(line: str) -> Tuple[str | int, str | List[str]]:
     """
 
     # Remove comments and strip whitespace
-    line = line.split("#")[0]
-    line = line.strip()
+    line = line.partition("#")[0].strip()
     if len(line) <= 2:
         # Line too short - not a configuration parameter
         return 0, line
@@ -170,12 +239,11 @@ def parse_config_line(line: str) -> Tuple[str | int, str | List[str]]:
         return 0, line
 
     # Regular configuration parameter
-    pair: List[str] = line.split("=", maxsplit=1)
     # only the first '=' matters
-    if len(pair) == 1:
+    config_key, separator, config_value = line.partition("=")
+    if not separator:
         # no separator
         return 0, line
-    config_key, config_value = pair
     config_key = config_key.strip()
     config_value = config_value.strip()
     if config_key == "" or config_value == "":
@@ -187,9 +255,8 @@ def parse_config_line(line: str) -> Tuple[str | int, str | List[str]]:
         and config_value[len(config_value) - 1] == "]"
     ):
         # Value is a list
-        lst: List[str] = config_value[1 : len(config_value) - 1].split(",")
-        for i, _ in enumerate(lst):
-            lst[i] = lst[i].strip()
-        config_value = lst
+        config_value = [
+            x.strip() for x in config_value[1 : len(config_value) - 1].split(",")
+        ]
 
     return config_key, config_value
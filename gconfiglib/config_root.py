@@ -2,21 +2,38 @@
 
 import logging
 import os
-from typing import Callable, List, Optional, Type
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 from urllib import parse as urlparse
 
-from kazoo.client import KazooClient
+from kazoo.exceptions import KazooException
 
 from gconfiglib import utils
+from gconfiglib.config_abcs import ConfigObject
 from gconfiglib.config_node import ConfigNode
 from gconfiglib.config_reader import ConfigReader
 from gconfiglib.config_writer import ConfigWriter
-from gconfiglib.enums import NodeType
+from gconfiglib.enums import NodeType, Source
 from gconfiglib.template_node_base import TemplateNodeBase
 from gconfiglib.template_node_fixed import TemplateNodeFixed
 
+if TYPE_CHECKING:
+    from kazoo.client import KazooClient
+
 logger = logging.getLogger(__name__)
 
+# Zookeeper notifications arriving within this many seconds of each other trigger a single refresh
+ZK_REFRESH_DELAY = 0.05
+
+# ConfigReader is stateless, so a single instance is shared by all configuration objects
+_reader = ConfigReader()
+
+# Readers for file-based configuration sources
+_FILE_READERS: Dict[Source, Callable[[str], Optional[ConfigNode]]] = {
+    Source.JSON: _reader.json,
+    Source.CFG: _reader.cfg,
+}
+
 
 class ConfigRoot(ConfigNode):
     """Root configuration node.
@@ -50,9 +67,22 @@ class ConfigRoot(ConfigNode):
 
         """
 
-        self.zk_conn: Optional[KazooClient] = None
-        self.zk_update: bool = False
+        self._path: Optional[str] = None
+        self._obj_cache: Dict[str, ConfigObject] = {}
+        self.zk_conn: Optional["KazooClient"] = None
         self.zk_uri: str = ""
+        # Digest of configuration content last read from Zookeeper
+        self.zk_digest: Optional[str] = None
+        # Pending (debounced) refresh from Zookeeper
+        self._zk_refresh_timer: Optional[threading.Timer] = None
+        self._zk_timer_lock = threading.Lock()
+        # Held while configuration is being refreshed from Zookeeper
+        self._zk_refresh_lock = threading.Lock()
+        # Set when a refresh is requested, cleared when a refresh starts reading from Zookeeper
+        self._zk_refresh_pending = False
+        # Held while this process writes configuration to Zookeeper or sets watches on it.
+        # Watch notifications are ignored while it is held
+        self._zk_write_lock = threading.Lock()
         # Form candidate list
         candidate_list: List[str] = []
         if filename:
@@ -66,80 +96,43 @@ class ConfigRoot(ConfigNode):
             # Read configuration from a file
             for fname in candidate_list:
                 try:
-                    candidate_uri = urlparse.urlparse(fname)
-                    if candidate_uri.scheme == "zookeeper":
+                    source: Source = utils.source_type(fname)
+                    if source == Source.ZOOKEEPER:
+                        candidate_uri = urlparse.urlparse(fname)
                         self.zk_uri = f"{candidate_uri.scheme}://{candidate_uri.username}:{candidate_uri.password}@{candidate_uri.hostname}:{candidate_uri.port}/"
                         if not self.zk_conn:
                             self.zk_conn = utils.zk_connect(fname)
                         self._copy(self.read().zk(self.zk_conn, candidate_uri.path))
                         if hasattr(self, "attributes") and len(self.attributes) > 0:
-                            self.zk_update = True
-
-                            # Set data watch
-                            @self.zk_conn.DataWatch(self.zk_path)
-                            def cfg_refresh(data, stat):
-                                """
-                                Hook to refresh configuration object when data in Zookeeper node changes
-                                :param data: Not used, required by Zookeeper API
-                                :param stat: Zookeeper statistics object, used to get version
-                                """
-
-                                if not self.zk_update:
-                                    self.zk_update = True
-                                    self._copy(
-                                        self.read().zk(self.zk_conn, self.zk_path)
-                                    )
-                                    if template_gen:
-                                        # Validate new configuration
-                                        template = template_gen(self)
-                                        if (
-                                            isinstance(template, TemplateNodeFixed)
-                                            and template.name == "root"
-                                        ):
-                                            self._copy(template.validate(self))
-                                    logger.debug(
-                                        "Refreshing configuration to version %s",
-                                        stat.version,
+                            self.zk_digest = utils.content_digest(self.get())
+                            # Watches are called once when they are set, that call is ignored
+                            with self._zk_write_lock:
+                                # Set data watch. Data is not used, stat is used to get version
+                                self.zk_conn.DataWatch(self.zk_path)(
+                                    lambda data, stat: self._zk_changed(
+                                        template_gen,
+                                        "Configuration node changed to version %s",
+                                        stat.version if stat else None,
                                     )
-                                    self.zk_update = False
-
-                            self.zk_update = False
-
-                            # Set child watches
-                            if self.node_type == NodeType.AN:
-                                self.zk_update = True
-
-                                @self.zk_conn.ChildrenWatch(self.zk_path)
-                                def cfg_child_refresh(children):
-                                    """
-                                    Hook to refresh configuration object when data in Zookeeper child nodes changes
-                                    :param children: Not used, required by Zookeeper API
-                                    """
-
-                                    if not self.zk_update:
-                                        self.zk_update = True
-                                        self._copy(
-                                            self.read().zk(self.zk_conn, self.zk_path)
+                                )
+                                # Set child watches
+                                if self.node_type == NodeType.AN:
+                                    self.zk_conn.ChildrenWatch(self.zk_path)(
+                                        lambda children: self._zk_changed(
+                                            template_gen,
+                                            "Configuration child nodes changed",
                                         )
-                                        if template_gen:
-                                            # Validate new configuration
-                                            template = template_gen(self)
-                                            self._copy(template.validate(self))
-                                        logger.debug(
-                                            "Refreshing configuration due to chile node changes",
-                                        )
-                                        self.zk_update = False
-
-                                self.zk_update = False
-                            self.zk_update = False
+                                    )
 
-                    elif len(fname) > 5 and fname[-5:] == ".json":
-                        self._copy(self.read().json(fname))
-                        self.set_node_type(NodeType.CN)
+                    elif not os.path.isfile(fname):
+                        # Missing default paths are the common case, no need to raise and catch for them
+                        logger.debug("Configuration file %s does not exist", fname)
+                        continue
                     else:
-                        self._copy(self.read().cfg(fname))
+                        self._copy(_FILE_READERS[source](fname))
                         self.set_node_type(NodeType.CN)
-                except:  # noqa: E722
+                except (OSError, ValueError, AttributeError, KazooException):
+                    # Missing/unreadable file, invalid content or Zookeeper error - try next candidate
                     logger.debug("Unable to read configuration from %s", fname)
                     continue
 
@@ -159,24 +152,121 @@ class ConfigRoot(ConfigNode):
         if template_gen:
             # Validate configration
             self.template_gen = template_gen
-            template: Type[TemplateNodeBase] = template_gen(self)
-            if isinstance(template, TemplateNodeFixed) and template.name == "root":
-                logger.debug("Validating configuration")
-                self._copy(template.validate(self))
-                logger.debug("Completed configuration validation")
-            else:
-                logger.error("Invalid configuration template")
+            self._apply_template(template_gen)
 
         if not hasattr(self, "attributes") or len(self.attributes) == 0:
             logger.critical("Could not initialize configuration")
             raise ValueError("Could not initialize configuration")
 
+    def _apply_template(
+        self, template_gen: Callable[[ConfigNode], Type[TemplateNodeBase]]
+    ) -> None:
+        """
+        Validate configuration against the template, assigning default values to missing attributes
+        :param template_gen: Function that takes configuration as parameter and generates the validation template
+        """
+        template: Type[TemplateNodeBase] = template_gen(self)
+        if isinstance(template, TemplateNodeFixed) and template.name == "root":
+            logger.debug("Validating configuration")
+            self._copy(template.validate(self))
+            logger.debug("Completed configuration validation")
+        else:
+            logger.error("Invalid configuration template")
+
+    @property
+    def zk_update(self) -> bool:
+        """
+        Whether configuration is being written to Zookeeper by this process
+        :return: True while a write is in progress
+        """
+        return self._zk_write_lock.locked()
+
+    def _zk_changed(
+        self,
+        template_gen: Optional[Callable[[ConfigNode], Type[TemplateNodeBase]]],
+        message: str,
+        *args: Any,
+    ) -> None:
+        """
+        Internal method. Hook for Zookeeper watches, refreshes configuration when data
+        in Zookeeper node or its child nodes changes
+        :param template_gen: Function that takes configuration as parameter and generates the validation template
+        :param message: debug message describing the change
+        :param args: arguments for the debug message
+        """
+        if not self.zk_update:
+            logger.debug(message, *args)
+            self._schedule_zk_refresh(template_gen)
+
+    def _schedule_zk_refresh(
+        self, template_gen: Optional[Callable[[ConfigNode], Type[TemplateNodeBase]]]
+    ) -> None:
+        """
+        Schedule configuration refresh from Zookeeper.
+        Each call restarts the delay, so a burst of notifications results in a single refresh
+        :param template_gen: Function that takes configuration as parameter and generates the validation template
+        """
+        with self._zk_timer_lock:
+            if self._zk_refresh_timer is not None:
+                self._zk_refresh_timer.cancel()
+            self._zk_refresh_timer = threading.Timer(
+                ZK_REFRESH_DELAY, self._zk_refresh, args=(template_gen,)
+            )
+            self._zk_refresh_timer.daemon = True
+            self._zk_refresh_timer.start()
+
+    def _zk_refresh(
+        self, template_gen: Optional[Callable[[ConfigNode], Type[TemplateNodeBase]]]
+    ) -> None:
+        """
+        Re-read configuration from Zookeeper, and re-validate it if the content has changed.
+        If another refresh is in progress, it runs once more after it completes
+        :param template_gen: Function that takes configuration as parameter and generates the validation template
+        """
+        self._zk_refresh_pending = True
+        # Pending flag is re-checked after the lock is released, so a request made
+        # while another refresh was reading from Zookeeper is not lost
+        while self._zk_refresh_pending and self._zk_refresh_lock.acquire(
+            blocking=False
+        ):
+            try:
+                self._zk_refresh_pending = False
+                self._zk_refresh_once(template_gen)
+            finally:
+                self._zk_refresh_lock.release()
+
+    def _zk_refresh_once(
+        self, template_gen: Optional[Callable[[ConfigNode], Type[TemplateNodeBase]]]
+    ) -> None:
+        """
+        Internal method. Single pass of configuration refresh from Zookeeper. Called with refresh lock held
+        :param template_gen: Function that takes configuration as parameter and generates the validation template
+        """
+        if self.zk_update:
+            # Configuration is being written to Zookeeper by this process
+            return
+        try:
+            new_cfg = self.read().zk(self.zk_conn, self.zk_path)
+            digest = utils.content_digest(new_cfg.get())
+            if digest == self.zk_digest:
+                # Content is unchanged, no need to re-validate
+                logger.debug("Configuration is unchanged, skipping refresh")
+                return
+            self._copy(new_cfg)
+            if template_gen:
+                # Validate new configuration
+                self._apply_template(template_gen)
+            self.zk_digest = digest
+            logger.debug("Refreshed configuration from %s", self.zk_path)
+        except Exception:
+            logger.exception("Failed to refresh configuration from %s", self.zk_path)
+
     def read(self) -> ConfigReader:
         """
         Generates a reader for this node
         :return: ConfigReader object
         """
-        return ConfigReader()
+        return _reader
 
     def write(self) -> ConfigWriter:
         """
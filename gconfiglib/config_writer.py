@@ -3,9 +3,7 @@
 import json
 import logging
 import os
-from typing import Optional
-
-from kazoo.client import KazooClient
+from typing import List, Optional, Tuple
 
 from gconfiglib import utils
 from gconfiglib.config_attribute import ConfigAttribute
@@ -14,6 +12,9 @@ from gconfiglib.enums import NodeType
 
 logger = logging.getLogger(__name__)
 
+# Zookeeper payload of a node with no attributes of its own
+_EMPTY_JSON = b"{}"
+
 
 class ConfigWriter:
     """
@@ -48,23 +49,23 @@ class ConfigWriter:
         except IOError as e:
             logger.exception("Failed to open the file %s", filename, exc_info=True)
             raise IOError(f"Failed to open the file {filename}", e) from e
-        with open(filename, mode="w", encoding="utf-8") as f:
-            for node in self.cfg_obj.attributes.values():
-                if isinstance(node, ConfigAttribute):
-                    logger.error("cfg format does not support attributes at root level")
+        # Content is built before opening the file, so that unsupported structure
+        # doesn't leave a partially written file behind
+        parts: List[str] = []
+        for node in self.cfg_obj.attributes.values():
+            if isinstance(node, ConfigAttribute):
+                logger.error("cfg format does not support attributes at root level")
+                raise ValueError("cfg format does not support attributes at root level")
+            parts.append(f"\n[{node.name}]\n")
+            for attribute in node.attributes.values():
+                if isinstance(attribute, ConfigNode):
+                    logger.error("cfg format does not support multi-level hierarchy")
                     raise ValueError(
-                        "cfg format does not support attributes at root level"
+                        "cfg format does not support multi-level hierarchy"
                     )
-                f.write(f"\n[{node.name}]\n")
-                for attribute in node.attributes.values():
-                    if isinstance(attribute, ConfigNode):
-                        logger.error(
-                            "cfg format does not support multi-level hierarchy"
-                        )
-                        raise ValueError(
-                            "cfg format does not support multi-level hierarchy"
-                        )
-                    f.write(f"{attribute.name} = {attribute.value}\n")
+                parts.append(f"{attribute.name} = {attribute.value}\n")
+        with open(filename, mode="w", encoding="utf-8") as f:
+            f.write("".join(parts))
         logger.debug("Successfully saved configuration in %s", filename)
 
     def json(self, filename: str, force: bool = False) -> None:
@@ -79,15 +80,12 @@ class ConfigWriter:
         except IOError as e:
             logger.exception("Failed to open the file %s", filename, exc_info=True)
             raise IOError(f"Failed to open the file {filename}", e) from e
+        # Serialize before opening the file: content is written in one call,
+        # and a serialization error doesn't leave a truncated file behind
+        parts: List[str] = []
+        self.cfg_obj._dump_json(parts.append)
         with open(filename, mode="w", encoding="utf-8") as f:
-            json.dump(
-                self.cfg_obj.get(),
-                f,
-                ensure_ascii=True,
-                indent=4,
-                default=utils.json_serial,
-                separators=(",", ": "),
-            )
+            f.write("".join(parts))
         logger.debug("Successfully saved configuration in %s", filename)
 
     def zk(self, path: Optional[str] = None, force: bool = False) -> None:
@@ -102,42 +100,20 @@ class ConfigWriter:
         if not root.zk_conn:
             logger.error("No open Zookeeper connection")
             raise IOError("No open Zookeeper connection")
-        if not root.zk_update:
-            # Lock configuration from getting updated
-            root.zk_update = True
+        if not root._zk_write_lock.acquire(blocking=False):
+            # Another write from this process is in progress
+            logger.debug("Configuration is already being saved to Zookeeper")
+            return
+        # Held for the whole write, so that Zookeeper notifications caused by it don't trigger refresh
+        try:
             if path is None:
                 path = self.cfg_obj.zk_path
-
-            if self.cfg_obj.node_type == NodeType.C:
-                logger.error(
-                    "Write method called on Content node %s", self.cfg_obj.name
-                )
-                raise AttributeError(
-                    f"write method called on Content node {self.cfg_obj.name}"
-                )
-            elif self.cfg_obj.node_type == NodeType.CN:
-                content = json.dumps(
-                    self.cfg_obj.get(), ensure_ascii=True, default=utils.json_serial
-                )
-            elif (
-                self.cfg_obj.node_type == NodeType.AN
-                and len(self.cfg_obj.list_attributes()) > 0
-            ):
-                content = json.dumps(
-                    self.cfg_obj.get_attributes(),
-                    ensure_ascii=True,
-                    default=utils.json_serial,
-                )
-            else:
-                content = json.dumps({})
+            writes: List[Tuple[str, bytes]] = self._collect_writes(path)
 
             if root.zk_conn.exists(path):
                 if force:
                     # need to make sure there are no "orphans" from previous version of the configuration
-                    root.zk_update = False
                     root.zk_conn.delete(path, recursive=True)
-                    root.zk_conn.create(path, content.encode(), makepath=True)
-                    root.zk_update = True
                 else:
                     logger.error(
                         "Failed to save configuration - path already exists and force attribute is not set"
@@ -145,14 +121,73 @@ class ConfigWriter:
                     raise IOError(
                         "Failed to save configuration - path already exists and force attribute is not set"
                     )
-            else:
-                root.zk_conn.create(path, content.encode(), makepath=True)
-            if self.cfg_obj.node_type == NodeType.AN:
-                for node_name in self.cfg_obj.list_nodes():
-                    root.zk_update = False
-                    ConfigWriter(self.cfg_obj._get_obj(node_name)).zk(
-                        f"{path}/{node_name}", force=force
-                    )
-                    root.zk_update = True
-            root.zk_update = False
+            # Transaction create doesn't make missing parents, so the parent path is created first.
+            # The whole subtree is then written in one request
+            parent_path: str = path.rsplit("/", 1)[0]
+            if parent_path:
+                root.zk_conn.ensure_path(parent_path)
+            transaction = root.zk_conn.transaction()
+            for node_path, content in writes:
+                transaction.create(node_path, content)
+            results = transaction.commit()
+            failures: List[Tuple[str, Exception]] = [
+                (node_path, result)
+                for (node_path, _), result in zip(writes, results)
+                if isinstance(result, Exception)
+            ]
+            if failures:
+                from kazoo.exceptions import RolledBackError
+
+                # Operations that were fine are reported as rolled back when another one fails,
+                # so the failure that caused the rollback is raised, if there is one
+                failed_path, error = next(
+                    (
+                        failure
+                        for failure in failures
+                        if not isinstance(failure[1], RolledBackError)
+                    ),
+                    failures[0],
+                )
+                logger.error(
+                    "Failed to save configuration to %s: %r at %s",
+                    path,
+                    error,
+                    failed_path,
+                )
+                raise error
+        finally:
+            root._zk_write_lock.release()
         logger.debug("Successfully saved configuration to Zookeeper")
+
+    def _collect_writes(self, path: str) -> List[Tuple[str, bytes]]:
+        """
+        Internal method. Collects content of every node to be saved to Zookeeper
+        :param path: path to root node in Zookeeper
+        :return: list of (path, content) pairs, with every parent listed before its children
+        """
+        writes: List[Tuple[str, bytes]] = []
+        stack: List[Tuple[ConfigNode, str]] = [(self.cfg_obj, path)]
+        while stack:
+            node, node_path = stack.pop()
+            if node.node_type == NodeType.C:
+                logger.error("Write method called on Content node %s", node.name)
+                raise AttributeError(f"write method called on Content node {node.name}")
+            elif node.node_type == NodeType.CN:
+                content: bytes = json.dumps(
+                    node.get(), ensure_ascii=True, default=utils.json_serial
+                ).encode()
+            elif node.node_type == NodeType.AN and len(node.list_attributes()) > 0:
+                content = json.dumps(
+                    node.get_attributes(),
+                    ensure_ascii=True,
+                    default=utils.json_serial,
+                ).encode()
+            else:
+                content = _EMPTY_JSON
+            writes.append((node_path, content))
+            if node.node_type == NodeType.AN:
+                stack.extend(
+                    (node._get_obj(node_name), f"{node_path}/{node_name}")
+                    for node_name in reversed(node.list_nodes())
+                )
+        return writes
@@ -21,3 +21,20 @@ class Fmt(Enum):
 
     JSON = auto()
     TEXT = auto()
+
+
+class Source(Enum):
+    """Configuration source - Zookeeper, json file or plain text config file"""
+
+    ZOOKEEPER = auto()
+    JSON = auto()
+    CFG = auto()
+
+
+class TemplateKind(Enum):
+    """Template class tags - used to dispatch on template type during validation"""
+
+    NODE = auto()
+    NODE_SET = auto()
+    ATTR_FIXED = auto()
+    ATTR_VARIABLE = auto()
@@ -2,6 +2,7 @@
 """
 
 import datetime as dt
+import functools
 import json
 import logging
 from typing import Any, Callable, Optional
@@ -17,6 +18,8 @@ logger = logging.getLogger(__name__)
 class TemplateAttributeBase(TemplateBase):
     """
     Base attribute template
+    Validator results are cached per value. Validators whose result depends on anything
+    other than the value (e.g. a uniqueness check across attributes) must set __noncache__ = True
     """
 
     def __init__(
@@ -32,12 +35,40 @@ class TemplateAttributeBase(TemplateBase):
         :param value_type: Value type (int, str, etc.)
         :param validator: Validator function. Should take value as argument and return True or False
                             Raises ValueError on any validation failure
+                            Results are cached per value, unless the function has __noncache__ = True attribute
         :param default_value: Value to assign if missing from configuration object
         :param description: Attribute description (used when generating sample configuration files)
         """
         self.value_type = value_type
         self.default_value = default_value
         super().__init__(optional, validator, description)
+        # Caching wrapper for the validator, built on first use.
+        # Rebuilt when validator attribute is reassigned
+        self._cached_validator: Optional[Callable[[Any], bool]] = None
+        self._cached_validator_source: Optional[Callable[[Any], bool]] = None
+
+    def _run_validator(self, value: Any) -> bool:
+        """
+        Run validator function, using cached result when possible
+        :param value: Value to be validated
+        :return: validator result
+        """
+        if self.validator is not self._cached_validator_source:
+            self._cached_validator_source = self.validator
+            self._cached_validator = None
+            if not getattr(self.validator, "__noncache__", False):
+                self._cached_validator = functools.lru_cache(maxsize=1024, typed=True)(
+                    self.validator
+                )
+        if self._cached_validator is not None:
+            try:
+                hash(value)
+            except TypeError:
+                # Unhashable value (e.g. list) - can't be cached
+                pass
+            else:
+                return self._cached_validator(value)
+        return self.validator(value)
 
     def validate(
         self, value: ConfigAttributeABC, name: str
@@ -69,7 +100,7 @@ class TemplateAttributeBase(TemplateBase):
         if self.validator is not None:
             if not self.optional or value.value is not None:
                 try:
-                    valid = self.validator(value.value)
+                    valid = self._run_validator(value.value)
                     problem = ""
                 except ValueError as e:
                     valid = False
@@ -2,7 +2,9 @@
 import logging
 from typing import Any, Callable, Optional
 
+from gconfiglib import utils
 from gconfiglib.config_attribute import ConfigAttribute
+from gconfiglib.enums import TemplateKind
 from gconfiglib.template_attr_base import TemplateAttributeBase
 
 logger = logging.getLogger(__name__)
@@ -14,6 +16,8 @@ class TemplateAttributeFixed(TemplateAttributeBase):
     For an attribute with a fixed name
     """
 
+    _kind = TemplateKind.ATTR_FIXED
+
     def __init__(
         self,
         name: str,
@@ -32,7 +36,7 @@ class TemplateAttributeFixed(TemplateAttributeBase):
         :param default_value: Value to assign if missing from configuration object
         :param description: Attribute description (used when generating sample configuration files)
         """
-        self.name = name
+        self.name = utils.intern_name(name)
         super().__init__(optional, value_type, validator, default_value, description)
 
     def validate(self, value: Optional[ConfigAttribute]) -> Optional[ConfigAttribute]:
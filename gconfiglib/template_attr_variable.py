@@ -1,6 +1,7 @@
 """ Variable Attribute Template."""
 from typing import Any, Callable, Optional
 
+from gconfiglib.enums import TemplateKind
 from gconfiglib.template_attr_base import TemplateAttributeBase
 
 
@@ -10,6 +11,8 @@ class TemplateAttributeVariable(TemplateAttributeBase):
     For an attribute with a name not known until runtime
     """
 
+    _kind = TemplateKind.ATTR_VARIABLE
+
     def __init__(
         self,
         value_type: type = str,
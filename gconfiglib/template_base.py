@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 from typing import Any, Callable, Optional
 
 from gconfiglib.config_abcs import ConfigObject
-from gconfiglib.enums import Fmt
+from gconfiglib.enums import Fmt, TemplateKind
 
 
 class TemplateBase(ABC):
@@ -13,6 +13,9 @@ class TemplateBase(ABC):
     Common elements for all template objects
     """
 
+    # Template type tag, set by each concrete template class
+    _kind: TemplateKind
+
     def __init__(
         self,
         optional: bool = True,
@@ -1,10 +1,10 @@
 """ Base Node Template."""
 import logging
-from collections import OrderedDict
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, List, Optional
 
+from gconfiglib import utils
 from gconfiglib.config_node import ConfigNode
-from gconfiglib.enums import Fmt, NodeType
+from gconfiglib.enums import Fmt, NodeType, TemplateKind
 from gconfiglib.template_base import TemplateBase
 
 logger = logging.getLogger(__name__)
@@ -15,11 +15,13 @@ class TemplateNodeBase(TemplateBase):
     Node template base class
     """
 
+    _kind = TemplateKind.NODE
+
     def __init__(
         self,
         name: str,
         optional: bool = True,
-        validator: Optional[Callable[[OrderedDict[str, Any]], bool]] = None,
+        validator: Optional[Callable[[Dict[str, Any]], bool]] = None,
         description: Optional[str] = None,
         node_type: Optional[NodeType] = None,
     ) -> None:
@@ -31,8 +33,8 @@ class TemplateNodeBase(TemplateBase):
         :param description: Node description (used when generating sample configuration files)
         :param node_type: Node type: C (content), CN (content node), AN (abstract node)
         """
-        self.name = name
-        self.attributes: OrderedDict[str, TemplateBase] = OrderedDict()
+        self.name = utils.intern_name(name)
+        self.attributes: Dict[str, TemplateBase] = {}
         self.node_type = node_type
 
         super().__init__(optional, validator, description)
@@ -90,24 +92,25 @@ class TemplateNodeBase(TemplateBase):
         """
         description: str = self.description if self.description else ""
         if fmt == Fmt.JSON:
+            parts: List[str] = [
+                attribute.sample(fmt) for attribute in self.attributes.values()
+            ]
             if self.name == "root":
-                result: str = "{"
+                result: str = "{" + ", ".join(parts) + "}"
             else:
-                result = '"%s" : {' % self.name
-            for attribute in self.attributes.values():
-                result += attribute.sample(fmt) + ", "
-            result = result[:-2] + "}"
+                result = '"%s" : {' % self.name + ", ".join(parts) + "}"
         elif fmt == Fmt.TEXT:
             if self.name == "root":
-                result = ""
+                parts = []
             else:
-                result = f"# {description}\n# [{self.name}]\n"
+                parts = [f"# {description}\n# [{self.name}]\n"]
             for attribute in self.attributes.values():
                 if self.name != "root" and isinstance(attribute, TemplateNodeBase):
                     raise ValueError(
                         "Text format configuration files are not supported for multi-level node hierarchy"
                     )
-                result += attribute.sample(fmt)
+                parts.append(attribute.sample(fmt))
+            result = "".join(parts)
         else:
             raise ValueError("Unsupported sample format")
         return result
@@ -1,13 +1,13 @@
 """ Fixed Node Template."""
 import logging
-from typing import Optional
+from typing import Optional, Tuple
 
 from gconfiglib.config_attribute import ConfigAttribute
 from gconfiglib.config_node import ConfigNode
+from gconfiglib.enums import TemplateKind
 from gconfiglib.template_attr_fixed import TemplateAttributeFixed
 from gconfiglib.template_base import TemplateBase
 from gconfiglib.template_node_base import TemplateNodeBase
-from gconfiglib.template_node_set import TemplateNodeSet
 
 logger = logging.getLogger(__name__)
 
@@ -18,22 +18,39 @@ class TemplateNodeFixed(TemplateNodeBase):
     For a node with a fixed name
     """
 
+    # Flattened validation steps: (template kind, name, template). Built on first validation
+    _program: Optional[Tuple[Tuple[TemplateKind, str, TemplateBase], ...]] = None
+
     def add(self, attr: TemplateAttributeFixed | TemplateNodeBase) -> None:
         """
         Add child nodes/attribute templates
         :param attr: Any TemplateBase descendant object
         """
         if isinstance(attr, TemplateBase):
-            if attr.name in self.attributes.keys():
+            if attr.name in self.attributes:
                 raise ValueError(
                     f"Attribute or node {attr.name} can only be added to node {self.name} once"
                 )
             self.attributes[attr.name] = attr
+            # Template has changed - previously generated validation steps are no longer valid
+            self._program = None
         else:
             raise ValueError(
                 f"Attempt to add invalid attribute type to {self.name} template"
             )
 
+    def _compile(self) -> Tuple[Tuple[TemplateKind, str, TemplateBase], ...]:
+        """
+        Flatten child templates into a sequence of validation steps,
+        so that template type is resolved once rather than on every validation
+        :return: tuple of (template kind, name, template)
+        """
+        self._program = tuple(
+            (attr_t._kind, attr_t_name, attr_t)
+            for attr_t_name, attr_t in self.attributes.items()
+        )
+        return self._program
+
     def validate(self, node: Optional[ConfigNode]) -> Optional[ConfigNode]:
         """
         Validate a node
@@ -45,28 +62,22 @@ class TemplateNodeFixed(TemplateNodeBase):
         # If None, pass it back without further checks (missing optional node was not created)
         if node is None:
             return None
-        for attr_t_name, attr_t in self.attributes.items():
-            if isinstance(attr_t, TemplateNodeSet):
+        program = self._program if self._program is not None else self._compile()
+        for kind, attr_t_name, attr_t in program:
+            # Dispatch on template type tag rather than a chain of isinstance checks
+            if kind is TemplateKind.NODE_SET:
                 # For Node Set, need to pass in the full parent level object
                 node = attr_t.validate(node)
             else:
                 # For any other node or attribute, just pass the node/attribute itself
-                # For attributes we need to make sure they are not None first
-                if (
-                    isinstance(attr_t, TemplateAttributeFixed)
-                    and attr_t_name not in node.list_attributes()
-                ):
-                    test_attr = ConfigAttribute(
+                # node.attributes is keyed by name, so a direct lookup replaces a scan over all attributes
+                existing = node.attributes.get(attr_t_name)
+                if existing is None and kind is TemplateKind.ATTR_FIXED:
+                    # For attributes we need to make sure they are not None first
+                    existing = ConfigAttribute(
                         attr_t_name, value=attr_t.default_value, parent=node
                     )
-                else:
-                    test_attr = None
-
-                new_value: ConfigNode | ConfigAttribute = attr_t.validate(
-                    node._get_obj(attr_t_name)
-                    if attr_t_name in [x.name for x in node.attributes.values()]
-                    else test_attr
-                )
+                new_value: ConfigNode | ConfigAttribute = attr_t.validate(existing)
 
                 if (
                     isinstance(new_value, ConfigAttribute)
@@ -2,9 +2,10 @@
 import logging
 from typing import List, Optional
 
+from gconfiglib import utils
 from gconfiglib.config_attribute import ConfigAttribute
 from gconfiglib.config_node import ConfigNode
-from gconfiglib.enums import Fmt
+from gconfiglib.enums import Fmt, TemplateKind
 from gconfiglib.template_node_base import TemplateNodeBase
 
 logger = logging.getLogger(__name__)
@@ -15,6 +16,8 @@ class TemplateNodeSet(TemplateNodeBase):
     Template class for a set of either fixed or variable attribute nodes
     """
 
+    _kind = TemplateKind.NODE_SET
+
     def __init__(self, name: str, node: TemplateNodeBase, names_lst: List[str]) -> None:
         """
         :param name: Nodeset name
@@ -23,7 +26,6 @@ class TemplateNodeSet(TemplateNodeBase):
         """
         super().__init__(name)
         self.attributes["node"] = node
-        self.names_lst = names_lst
         if not isinstance(node, TemplateNodeBase):
             raise ValueError(
                 "Node Set template can only be initialized with a valid node template object"
@@ -32,6 +34,10 @@ class TemplateNodeSet(TemplateNodeBase):
             raise ValueError(
                 "Node Set template can only be initialized with a non-empty list of node names"
             )
+        self.names_lst = [utils.intern_name(name) for name in names_lst]
+        self._names_set = frozenset(self.names_lst)
+        if len(self._names_set) != len(names_lst):
+            raise ValueError(f"Node Set template {self.name} has duplicate node names")
 
     def validate(self, node: Optional[ConfigNode]) -> Optional[ConfigNode]:
         """
@@ -45,9 +51,13 @@ class TemplateNodeSet(TemplateNodeBase):
         # If None, pass it back without further checks (missing optional node was not created)
         if node is None:
             return None
+        # Loop invariants - the same template is applied to every node in the set
+        node_tpl: TemplateNodeBase = self.attributes["node"]
+        node_optional: bool = node_tpl.optional
+        existing = node.attributes
         for name in self.names_lst:
-            if name not in node.attributes.keys():
-                if not self.attributes["node"].optional:
+            if name not in existing:
+                if not node_optional:
                     node.add(ConfigNode(name))
                     logger.error(
                         "Mandatory node %s is missing in %s", name, node.get_path()
@@ -59,7 +69,7 @@ class TemplateNodeSet(TemplateNodeBase):
                         node.get_path(),
                     )
                     continue
-            new_value = self.attributes["node"].validate(node._get_obj(name))
+            new_value = node_tpl.validate(existing[name])
             if isinstance(new_value, ConfigAttribute) and new_value.value is not None:
                 node.add(new_value)
             elif isinstance(new_value, ConfigNode) and len(new_value.attributes) > 0:
@@ -74,28 +84,30 @@ class TemplateNodeSet(TemplateNodeBase):
         :param fmt: JSON or TEXT
         :return: string
         """
-        description: str = (
-            self.attributes["node"].description
-            if self.attributes["node"].description
-            else ""
-        )
-        result: str
-        for node_name in self.names_lst:
-            if fmt == Fmt.JSON:
-                result = '"%s" : {' % node_name
-                for attribute in self.attributes["node"].attributes.values():
-                    result += attribute.sample(fmt) + ", "
-                result = result[:-2] + "}, "
-            elif fmt == Fmt.TEXT:
-                result = f"# {description}\n# [{node_name}]\n"
-                for attribute in self.attributes["node"].attributes.values():
-                    if isinstance(attribute, TemplateNodeBase):
-                        raise ValueError(
-                            "Text format configuration files are not supported for multi-level node hierarchy"
-                        )
-                    result += attribute.sample(fmt)
-            else:
-                raise ValueError("Unsupported sample format")
+        node_tpl: TemplateNodeBase = self.attributes["node"]
+        description: str = node_tpl.description if node_tpl.description else ""
         if fmt == Fmt.JSON:
-            result = result[:-2]
+            # All nodes in the set share the same template, so attribute samples are generated once
+            attributes: str = ", ".join(
+                attribute.sample(fmt) for attribute in node_tpl.attributes.values()
+            )
+            result: str = ", ".join(
+                '"%s" : {' % node_name + attributes + "}"
+                for node_name in self.names_lst
+            )
+        elif fmt == Fmt.TEXT:
+            parts: List[str] = []
+            for attribute in node_tpl.attributes.values():
+                if isinstance(attribute, TemplateNodeBase):
+                    raise ValueError(
+                        "Text format configuration files are not supported for multi-level node hierarchy"
+                    )
+                parts.append(attribute.sample(fmt))
+            attributes = "".join(parts)
+            result = "".join(
+                f"# {description}\n# [{node_name}]\n" + attributes
+                for node_name in self.names_lst
+            )
+        else:
+            raise ValueError("Unsupported sample format")
         return result
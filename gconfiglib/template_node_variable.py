@@ -1,7 +1,6 @@
 """ Node with Variable Attributes Template."""
 import logging
-from collections import OrderedDict
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional
 
 from gconfiglib.config_attribute import ConfigAttribute
 from gconfiglib.config_node import ConfigNode
@@ -22,7 +21,7 @@ class TemplateNodeVariableAttr(TemplateNodeBase):
         name: str,
         attr: TemplateAttributeVariable,
         optional: bool = True,
-        validator: Optional[Callable[[OrderedDict[str, Any]], bool]] = None,
+        validator: Optional[Callable[[Dict[str, Any]], bool]] = None,
         description: Optional[str] = None,
         node_type: Optional[NodeType] = None,
     ) -> None:
@@ -36,7 +35,7 @@ class TemplateNodeVariableAttr(TemplateNodeBase):
         :param node_type: Node type: C (content), CN (content node), AN (abstract node)
         """
         super().__init__(name, optional, validator, description, node_type)
-        self.attributes: OrderedDict[str, TemplateAttributeVariable] = OrderedDict()
+        self.attributes: Dict[str, TemplateAttributeVariable] = {}
         if not isinstance(attr, TemplateAttributeVariable):
             raise ValueError(
                 f"Attempt to add invalid attribute type to {self.name} template. This node can contain only one TemplateAttributeVariable attribute template and nothing else"
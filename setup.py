@@ -7,6 +7,7 @@ setup(
     setup_requires=["setuptools_scm"],
     name="gconfiglib",
     packages=["gconfiglib"],
+    package_data={"gconfiglib": ["py.typed", "*.pyi"]},
     entry_points={"console_scripts": ["cfgctl = gconfiglib.config:main"]},
     install_requires=["kazoo", "pandas"],
     test_suite="nose.collector",